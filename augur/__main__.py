@@ -2,13 +2,16 @@
 Stub function and module used as a setuptools entry point.
 """
 
-import augur
-from sys import argv, exit
+from sys import argv
+
+# Import the CLI module directly rather than going through the augur
+# package's run() shim, so dispatch doesn't depend on package attributes.
+from augur.cli import run
 
 # Entry point for setuptools-installed script and bin/augur dev wrapper.
 def main():
-    return augur.run( argv[1:] )
+    return run( argv[1:] )
 
 # Run when called as `python -m augur`, here for good measure.
 if __name__ == "__main__":
-    exit( main() )
+    raise SystemExit( main() )
@@ -6,7 +6,7 @@ import os
 from shutil import copyfile
 import numpy as np
 from Bio import AlignIO, SeqIO, Seq, Align
-from .utils import run_shell_command, nthreads_value, shquote
+from .utils import run_shell_command, shquote, add_nthreads_argument
 from collections import defaultdict
 
 class AlignmentError(Exception):
@@ -18,9 +18,8 @@ class AlignmentError(Exception):
 def register_arguments(parser):
     parser.add_argument('--sequences', '-s', required=True, nargs="+", metavar="FASTA", help="sequences to align")
     parser.add_argument('--output', '-o', default="alignment.fasta", help="output file (default: %(default)s)")
-    parser.add_argument('--nthreads', type=nthreads_value, default=1,
-                                help="number of threads to use; specifying the value 'auto' will cause the number of available CPU cores on your system, if determinable, to be used")
-    parser.add_argument('--method', default='mafft', choices=["mafft"], help="alignment program to use")
+    add_nthreads_argument(parser)
+    parser.add_argument('--method', default='mafft', choices=("mafft",), help="alignment program to use")
     parser.add_argument('--reference-name', metavar="NAME", type=str, help="strip insertions relative to reference sequence; use if the reference is already in the input sequences")
     parser.add_argument('--reference-sequence', metavar="PATH", type=str, help="Add this reference sequence to the dataset & strip insertions relative to this. Use if the reference is NOT already in the input sequences")
     parser.add_argument('--remove-reference', action="store_true", default=False, help="remove reference sequence from the alignment")
@@ -6,7 +6,7 @@ import os, shutil, time, json, sys
 from Bio import Phylo, SeqIO
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
-from .utils import read_tree, InvalidTreeError, write_json, get_json_name
+from .utils import read_tree, InvalidTreeError, write_json, get_json_name, add_vcf_reference_argument
 from treetime.vcf_utils import read_vcf, write_vcf
 from collections import defaultdict
 
@@ -106,9 +106,9 @@ def register_arguments(parser):
     parser.add_argument('--alignment', '-a', help="alignment in fasta or VCF format")
     parser.add_argument('--output-node-data', type=str, help='name of JSON file to save mutations and ancestral sequences to')
     parser.add_argument('--output-sequences', type=str, help='name of FASTA file to save ancestral sequences to (FASTA alignments only)')
-    parser.add_argument('--inference', default='joint', choices=["joint", "marginal"],
+    parser.add_argument('--inference', default='joint', choices=("joint", "marginal"),
                                     help="calculate joint or marginal maximum likelihood ancestral sequence states")
-    parser.add_argument('--vcf-reference', type=str, help='fasta file of the sequence the VCF was mapped to')
+    add_vcf_reference_argument(parser)
     parser.add_argument('--output-vcf', type=str, help='name of output VCF file which will include ancestral seqs')
     ambiguous = parser.add_mutually_exclusive_group()
     ambiguous.add_argument('--keep-ambiguous', action="store_true",
@@ -0,0 +1,82 @@
+"""
+Extensions to argparse used by the augur CLI.
+
+Kept in their own module so that code paths which never build a parser—most
+notably the --version fast path in :mod:`augur.cli`—never import argparse
+at all.
+"""
+
+import argparse
+
+
+def identity(string):
+    """
+    Drop-in for the default ``type=None`` registration argparse makes, which
+    is a function local to ``ArgumentParser.__init__`` and so can't be
+    pickled with the parser.
+    """
+    return string
+
+
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    A subparsers action which defers filling in each command's arguments
+    until the command is actually dispatched to.
+
+    add_parser() accepts an extra *build* callable; the returned subparser is
+    registered as a stub carrying only its name, help, and description—enough
+    for the top-level help listing—and *build* is called on it just before the
+    first (and only) time it's asked to parse anything.  Commands never
+    dispatched to never pay for their add_argument calls.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._builders = {}
+
+    def add_parser(self, name, *, build = None, **kwargs):
+        parser = super().add_parser(name, **kwargs)
+        parser.register('type', None, identity)
+        if build is not None:
+            self._builders[name] = build
+        return parser
+
+    def __call__(self, parser, namespace, values, option_string = None):
+        build = self._builders.pop(values[0], None)
+        if build is not None:
+            build(self._name_parser_map[values[0]])
+        super().__call__(parser, namespace, values, option_string)
+
+    def build_all(self):
+        """
+        Run every pending builder, for consumers which introspect the parser
+        instead of dispatching through it (e.g. doc generation).
+        """
+        while self._builders:
+            name, build = self._builders.popitem()
+            build(self._name_parser_map[name])
+
+
+def canonicalize_suppress(parser):
+    """
+    Re-establish the identity of argparse.SUPPRESS markers after unpickling.
+
+    argparse compares its SUPPRESS sentinel with ``is``, but pickling copies
+    the string, so a freshly-loaded parser would leak ``==SUPPRESS==``
+    defaults into help output and parsed namespaces.
+    """
+    for action in parser._actions:
+        for attr in ("default", "help", "dest", "metavar"):
+            if getattr(action, attr, None) == argparse.SUPPRESS:
+                setattr(action, attr, argparse.SUPPRESS)
+
+        if isinstance(action, argparse._SubParsersAction):
+            for subparser in action._name_parser_map.values():
+                canonicalize_suppress(subparser)
+
+    if parser.argument_default == argparse.SUPPRESS:
+        parser.argument_default = argparse.SUPPRESS
+
+    if parser.usage == argparse.SUPPRESS:
+        parser.usage = argparse.SUPPRESS
+
+    return parser
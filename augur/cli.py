@@ -0,0 +1,329 @@
+"""
+The top-level augur command which dispatches to subcommands.
+"""
+
+import functools
+import os
+import sys
+import importlib
+
+# The command table: one row per command, mapping its name on the command
+# line to its module basename.  This is the single declarative source for
+# registration, sniffing, and dispatch; iterating it never imports a command
+# module.
+COMMANDS = {
+    "parse":                 "parse",
+    "index":                 "index",
+    "filter":                "filter",
+    "mask":                  "mask",
+    "align":                 "align",
+    "tree":                  "tree",
+    "refine":                "refine",
+    "ancestral":             "ancestral",
+    "translate":             "translate",
+    "reconstruct-sequences": "reconstruct_sequences",
+    "clades":                "clades",
+    "traits":                "traits",
+    "sequence-traits":       "sequence_traits",
+    "lbi":                   "lbi",
+    "distance":              "distance",
+    "titers":                "titers",
+    "frequencies":           "frequencies",
+    "export":                "export",
+    "validate":              "validate",
+    "version":               "version",
+    "import":                "import",
+}
+
+# Command names as they appear on the command line, precomputed once so the
+# sniff on every startup is a couple of O(1) lookups with no allocation.
+COMMAND_NAMES = frozenset(COMMANDS)
+
+class LazyCommand():
+    """
+    Stand-in for a command module which defers the module import until the
+    command is actually run.
+
+    Dispatching through this proxy means running one command never pays the
+    import cost of any other command's dependencies.
+    """
+    def __init__(self, module_name):
+        self.module_name = module_name
+
+    def run(self, args):
+        return importlib.import_module(self.module_name).run(args)
+
+
+def sniff_command(argv):
+    """
+    Scan *argv* for the name of the command being invoked, without parsing.
+
+    Returns the first token matching a known command name, or None if no
+    command could be identified (e.g. for ``augur --help`` or a typo'd
+    command name).
+    """
+    for token in argv:
+        if token in COMMAND_NAMES:
+            return token
+        if not token.startswith("-"):
+            # The first non-option token must be the command; if we don't
+            # recognize it, leave it to argparse to report the error.
+            return None
+
+    return None
+
+
+def version_requested(argv):
+    """
+    True if *argv* asks for the version at the top level, i.e. with
+    ``--version`` appearing before any command name.
+
+    It's not uncommon to blindly run a command with --version as the sole
+    argument, so its useful to make that Just Work.  Answering it before any
+    parser exists means the question costs nothing but the scan.
+    """
+    for token in argv:
+        if token == "--version":
+            return True
+        if not token.startswith("-"):
+            return False
+
+    return False
+
+
+def help_requested(argv):
+    """
+    True if *argv* asks for help anywhere.
+    """
+    return "-h" in argv or "--help" in argv
+
+
+def effective_command(argv):
+    """
+    The single command whose subparser this invocation needs, or None if the
+    full parser is required.
+
+    Help requested *before* the command—``augur --help tree``—goes to the
+    top-level parser, which must list every command, so only trust the sniff
+    when the command comes first.
+    """
+    command = sniff_command(argv)
+
+    if command and help_requested(argv):
+        help_index = min(argv.index(token) for token in ("-h", "--help") if token in argv)
+        if help_index < argv.index(command):
+            return None
+
+    return command
+
+
+def make_parser(argv = None):
+    """
+    Build the top-level argument parser.
+
+    If *argv* is given, only the subparser for the command it names is fully
+    constructed; the others are never going to be consulted for this
+    invocation, so building them (and importing their modules) is wasted
+    work.  Without *argv*—or when no command can be identified, as for
+    ``augur --help``—every subparser is built.
+    """
+    # Deferred: argparse costs a notable slice of a cold start, and neither
+    # it nor our extensions to it are needed on the version fast path or a
+    # parser-cache hit.
+    import argparse
+    from .argparse_ import LazySubParsersAction, identity
+
+    parser = argparse.ArgumentParser(
+        prog        = "augur",
+        description = "Augur: A bioinformatics toolkit for phylogenetic analysis.")
+
+    parser.register('type', None, identity)
+
+    subparsers = parser.add_subparsers(action = LazySubParsersAction)
+
+    add_default_command(parser)
+
+    # The defaults-annotating formatter only earns its keep when help is
+    # actually going to be rendered; the base formatter handles usage lines
+    # and error messages identically.
+    if argv is None or help_requested(argv):
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter
+    else:
+        formatter_class = argparse.HelpFormatter
+
+    command = effective_command(argv) if argv is not None else None
+
+    if command:
+        add_command_subparser(subparsers, command, formatter_class)
+    else:
+        for name in COMMANDS:
+            add_command_subparser(subparsers, name, formatter_class)
+
+    if argv is None:
+        # A caller with no argv isn't parsing a live command line; it wants
+        # the whole parser, populated, as make_parser() always returned
+        # (sphinx-argparse introspects it to document every command).
+        subparsers.build_all()
+
+    return parser
+
+
+def add_command_subparser(subparsers, name, formatter_class = None):
+    """
+    Add a subparser for the single command known as *name* in the
+    :data:`COMMANDS` table.
+
+    *formatter_class* defaults to argparse.ArgumentDefaultsHelpFormatter,
+    left unnamed in the signature so importing this module doesn't import
+    argparse.
+    """
+    import argparse
+
+    if formatter_class is None:
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter
+
+    # Deferred import: utils drags in pandas, BioPython, et al., which merely
+    # importing the augur package shouldn't cost anyone.
+    from .utils import first_line
+
+    command_string = COMMANDS[name]
+    command = importlib.import_module('augur.' + command_string)
+
+    subparser = subparsers.add_parser(
+        name,
+        help        = first_line(command.__doc__),
+        description = command.__doc__,
+
+        # Lets the command register arguments on its subparser, but not
+        # until the command is dispatched to.
+        build       = functools.partial(register_command_arguments, command_string))
+
+    subparser.set_defaults(__command__ = LazyCommand(command.__name__))
+
+    # Use the same formatting class for every command for consistency.
+    # Set here to avoid repeating it in every command's register_parser().
+    subparser.formatter_class = formatter_class
+
+    return subparser
+
+
+def register_command_arguments(command_string, subparser):
+    """
+    Builder run by :class:`LazySubParsersAction` when *subparser*'s command
+    is dispatched to.
+    """
+    importlib.import_module('augur.' + command_string).register_arguments(subparser)
+
+
+def parser_cache_file(command, with_help = False):
+    """
+    Path of the cache file for the parser handling *command* (None for the
+    full parser).
+
+    The name embeds everything the built parser depends on—augur version,
+    Python version, this file's mtime, and whether the parser was built with
+    the help-rendering formatter—so a stale cache is simply never looked up
+    again.
+    """
+    from .__version__ import __version__
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(
+        cache_home,
+        "augur",
+        "parser-%s-py%d.%d-%d-%s%s.pickle" % (
+            __version__,
+            sys.version_info[0],
+            sys.version_info[1],
+            max(int(os.stat(__file__).st_mtime),
+                int(os.stat(os.path.join(os.path.dirname(__file__), "argparse_.py")).st_mtime)),
+            command or "all",
+            "-help" if with_help else ""))
+
+
+def load_or_build_parser(argv = None):
+    """
+    Like :func:`make_parser`, but backed by an on-disk pickle cache.
+
+    Parser construction is pure—it depends only on the augur version and
+    which command *argv* names—so after the first invocation the built
+    parser can be unpickled instead of re-imported and re-registered.  The
+    cache is strictly best-effort: any failure reading or writing it falls
+    back to building the parser as usual.
+    """
+    import pickle
+
+    # Even computing the cache path is best-effort: it stats source files
+    # and reads the version, neither of which is guaranteed under every
+    # packaging (zipimport, frozen installs).
+    try:
+        cache_file = parser_cache_file(
+            effective_command(argv) if argv is not None else None,
+            argv is None or help_requested(argv))
+    except Exception:
+        cache_file = None
+
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as file:
+                parser = pickle.load(file)
+        except Exception:
+            pass
+        else:
+            from .argparse_ import canonicalize_suppress
+            return canonicalize_suppress(parser)
+
+    parser = make_parser(argv)
+
+    if cache_file is not None:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok = True)
+
+            # Write-then-rename so concurrent invocations never read a partial
+            # pickle.
+            temp_file = "%s.%d" % (cache_file, os.getpid())
+
+            with open(temp_file, "wb") as file:
+                pickle.dump(parser, file, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_file, cache_file)
+        except Exception:
+            pass
+
+    return parser
+
+
+def run(argv):
+    # Fast path for the version, which doesn't need a parser (or anything
+    # else) at all.  Saves building argparse machinery just to throw it away.
+    if argv == ["version"] or version_requested(argv):
+        from types import SimpleNamespace
+        from . import version
+        return version.run(SimpleNamespace())
+
+    args = load_or_build_parser(argv).parse_args(argv)
+    try:
+        return args.__command__.run(args)
+    except RecursionError:
+        print("FATAL: Maximum recursion depth reached. You can set the env variable AUGUR_RECURSION_LIMIT to adjust this (current limit: {})".format(sys.getrecursionlimit()))
+        sys.exit(2)
+
+
+class default_command():
+    """
+    The default command, run when none is provided: print the parser's help.
+    """
+    def __init__(self, parser):
+        self.parser = parser
+
+    def run(self, args):
+        self.parser.print_help()
+        return 2
+
+
+def add_default_command(parser):
+    """
+    Sets the default command to run when none is provided.
+    """
+    parser.set_defaults(__command__ = default_command(parser))
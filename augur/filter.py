@@ -14,7 +14,7 @@ from tempfile import NamedTemporaryFile
 import treetime.utils
 
 from .index import index_sequences
-from .utils import read_metadata, get_numerical_dates, run_shell_command, shquote, is_date_ambiguous
+from .utils import read_metadata, get_numerical_dates, run_shell_command, shquote, is_date_ambiguous, add_sequences_argument
 
 comment_char = '#'
 MAX_NUMBER_OF_PROBABILISTIC_SAMPLING_ATTEMPTS = 10
@@ -92,7 +92,7 @@ def filter_by_query(sequences, metadata_file, query):
     return [seq for seq in sequences if seq in filtered_meta_dict]
 
 def register_arguments(parser):
-    parser.add_argument('--sequences', '-s', required=True, help="sequences in fasta or VCF format")
+    add_sequences_argument(parser)
     parser.add_argument('--metadata', required=True, metavar="FILE", help="sequence metadata, as CSV or TSV")
     parser.add_argument('--sequence-index', help="sequence composition report generated by augur index. If not provided, an index will be created on the fly.")
     parser.add_argument('--min-date', type=numeric_date, help="minimal cutoff for date; may be specified as an Augur-style numeric date (with the year as the integer part) or YYYY-MM-DD")
@@ -114,7 +114,7 @@ def register_arguments(parser):
                                 help="Exclude samples matching these conditions. Ex: \"host=rat\" or \"host!=rat\". Multiple values are processed as OR (matching any of those specified will be excluded), not AND")
     parser.add_argument('--include-where', nargs='+',
                                 help="Include samples with these values. ex: host=rat. Multiple values are processed as OR (having any of those specified will be included), not AND. This rule is applied last and ensures any sequences matching these rules will be included.")
-    parser.add_argument('--exclude-ambiguous-dates-by', choices=['any', 'day', 'month', 'year'],
+    parser.add_argument('--exclude-ambiguous-dates-by', choices=('any', 'day', 'month', 'year'),
                                 help='Exclude ambiguous dates by day (e.g., 2020-09-XX), month (e.g., 2020-XX-XX), year (e.g., 200X-10-01), or any date fields. An ambiguous year makes the corresponding month and day ambiguous, too, even if those fields have unambiguous values (e.g., "201X-10-01"). Similarly, an ambiguous month makes the corresponding day ambiguous (e.g., "2010-XX-01").')
     parser.add_argument('--query', help="Filter samples by attribute. Uses Pandas Dataframe querying, see https://pandas.pydata.org/pandas-docs/stable/user_guide/indexing.html#indexing-query for syntax.")
     parser.add_argument('--output', '-o', help="output file", required=True)
@@ -16,15 +16,15 @@ from .utils import read_metadata, read_node_data, write_json, get_numerical_date
 
 def register_arguments(parser):
     # Shared arguments
-    parser.add_argument('--method', choices=["diffusion", "kde"], required=True,
+    parser.add_argument('--method', choices=("diffusion", "kde"), required=True,
                         help="method by which frequencies should be estimated")
     parser.add_argument('--metadata', type=str, required=True, metavar="FILE",
                         help="metadata including dates for given samples, as CSV or TSV")
-    parser.add_argument('--regions', type=str, nargs='+', default=['global'],
+    parser.add_argument('--regions', type=str, nargs='+', default=('global',),
                         help="region to subsample to")
     parser.add_argument("--pivot-interval", type=int, default=3,
                         help="number of units between pivots")
-    parser.add_argument("--pivot-interval-units", type=str, default="months", choices=['months', 'weeks'],
+    parser.add_argument("--pivot-interval-units", type=str, default="months", choices=('months', 'weeks'),
                         help="space pivots by months (default) or by weeks")
     parser.add_argument('--min-date', type=numeric_date,
                         help="date to begin frequencies calculations; may be specified as an Augur-style numeric date (with the year as the integer part) or YYYY-MM-DD")
@@ -67,7 +67,7 @@ def register_arguments(parser):
                         "in absense of data (inertia=0 -> go flat, inertia=1.0 -> continue current trend)")
 
     # Output arguments
-    parser.add_argument('--output-format', default='auspice', choices=['auspice', 'nextflu'],
+    parser.add_argument('--output-format', default='auspice', choices=('auspice', 'nextflu'),
                         help="format to export frequencies JSON depending on the viewing interface")
     parser.add_argument('--output', '-o', type=str,
                         help='JSON file to save estimated frequencies to')
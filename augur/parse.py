@@ -5,6 +5,8 @@ Parse delimited fields from FASTA sequence names into a TSV and FASTA file.
 from Bio import SeqIO
 import pandas as pd
 
+from .utils import add_sequences_argument
+
 forbidden_chactacters = str.maketrans(
     {' ': None,
      '(': '_',
@@ -69,13 +71,13 @@ def prettify(x, trim=0, camelCase=False, etal=None, removeComma=False):
 
 
 def register_arguments(parser):
-    parser.add_argument('--sequences', '-s', required=True, help="sequences in fasta or VCF format")
+    add_sequences_argument(parser)
     parser.add_argument('--output-sequences', help="output sequences file")
     parser.add_argument('--output-metadata', help="output metadata file")
     parser.add_argument('--fields', nargs='+', help="fields in fasta header")
     parser.add_argument('--prettify-fields', nargs='+', help="apply string prettifying operations (underscores to spaces, capitalization, etc) to specified metadata fields")
     parser.add_argument('--separator', default='|', help="separator of fasta header")
-    parser.add_argument('--fix-dates', choices=['dayfirst', 'monthfirst'],
+    parser.add_argument('--fix-dates', choices=('dayfirst', 'monthfirst'),
                                 help="attempt to parse non-standard dates and output them in standard YYYY-MM-DD format")
 
 
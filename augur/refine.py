@@ -4,7 +4,7 @@ Refine an initial tree using sequence metadata.
 import numpy as np
 import os, shutil, time, sys
 from Bio import Phylo
-from .utils import read_metadata, read_tree, get_numerical_dates, write_json, InvalidTreeError
+from .utils import read_metadata, read_tree, get_numerical_dates, write_json, InvalidTreeError, add_vcf_reference_argument
 from treetime.vcf_utils import read_vcf, write_vcf
 from treetime.seq_utils import profile_maps
 
@@ -108,18 +108,18 @@ def register_arguments(parser):
                                 "Use --no-covariance to turn off.")
     parser.add_argument('--no-covariance', dest='covariance', action='store_false')  #If you set help here, it displays 'default: True' - which is confusing!
     parser.add_argument('--keep-polytomies', action='store_true', help='Do not attempt to resolve polytomies')
-    parser.add_argument('--precision', type=int, choices=[0,1,2,3], help="precision used by TreeTime to determine the number of grid points that are used for the evaluation of the branch length interpolation objects. Values range from 0 (rough) to 3 (ultra fine) and default to 'auto'.")
+    parser.add_argument('--precision', type=int, choices=(0,1,2,3), help="precision used by TreeTime to determine the number of grid points that are used for the evaluation of the branch length interpolation objects. Values range from 0 (rough) to 3 (ultra fine) and default to 'auto'.")
     parser.add_argument('--date-format', default="%Y-%m-%d", help="date format")
     parser.add_argument('--date-confidence', action="store_true", help="calculate confidence intervals for node dates")
-    parser.add_argument('--date-inference', default='joint', choices=["joint", "marginal"],
+    parser.add_argument('--date-inference', default='joint', choices=("joint", "marginal"),
                                 help="assign internal nodes to their marginally most likely dates, not jointly most likely")
-    parser.add_argument('--branch-length-inference', default='auto', choices = ['auto', 'joint', 'marginal', 'input'],
+    parser.add_argument('--branch-length-inference', default='auto', choices = ('auto', 'joint', 'marginal', 'input'),
                                 help='branch length mode of treetime to use')
     parser.add_argument('--clock-filter-iqd', type=float, help='clock-filter: remove tips that deviate more than n_iqd '
                                 'interquartile ranges from the root-to-tip vs time regression')
-    parser.add_argument('--vcf-reference', type=str, help='fasta file of the sequence the VCF was mapped to')
+    add_vcf_reference_argument(parser)
     parser.add_argument('--year-bounds', type=int, nargs='+', help='specify min or max & min prediction bounds for samples with XX in year')
-    parser.add_argument('--divergence-units', type=str, choices=['mutations', 'mutations-per-site'],
+    parser.add_argument('--divergence-units', type=str, choices=('mutations', 'mutations-per-site'),
                         default='mutations-per-site', help='Units in which sequence divergences is exported.')
     parser.add_argument('--seed', type=int, help='seed for random number generation')
     parser.set_defaults(covariance=True)
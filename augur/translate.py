@@ -5,7 +5,7 @@ Translate gene regions from nucleotides to amino acids.
 import os, sys
 import numpy as np
 from Bio import SeqIO, SeqFeature, Seq, SeqRecord, Phylo
-from .utils import read_node_data, load_features, write_json, write_VCF_translation, get_json_name
+from .utils import read_node_data, load_features, write_json, write_VCF_translation, get_json_name, add_vcf_reference_argument
 from treetime.vcf_utils import read_vcf
 
 class MissingNodeError(Exception):
@@ -312,7 +312,7 @@ def register_arguments(parser):
                                    "If a VCF-input, a .vcf or .vcf.gz will be output here (depending on file ending). If fasta-input, specify the file name "
                                    "like so: 'my_alignment_%%GENE.fasta', where '%%GENE' will be replaced by the name of the gene")
     parser.add_argument('--vcf-reference-output', type=str, help="fasta file where reference sequence translations for VCF input will be written")
-    parser.add_argument('--vcf-reference', type=str, help='fasta file of the sequence the VCF was mapped to')
+    add_vcf_reference_argument(parser)
 
 
 def run(args):
@@ -485,6 +485,30 @@ def nthreads_value(value):
         raise argparse.ArgumentTypeError("'%s' is not an integer or the word 'auto'" % value) from None
 
 
+def add_nthreads_argument(parser):
+    """
+    Register the standard --nthreads argument, shared by every command which
+    parallelizes across threads, so the flag behaves identically everywhere.
+    """
+    parser.add_argument('--nthreads', type=nthreads_value, default=1,
+                                help="number of threads to use; specifying the value 'auto' will cause the number of available CPU cores on your system, if determinable, to be used")
+
+
+def add_vcf_reference_argument(parser, help='fasta file of the sequence the VCF was mapped to'):
+    """
+    Register the standard --vcf-reference argument, shared by every command
+    which accepts VCF input.
+    """
+    parser.add_argument('--vcf-reference', type=str, help=help)
+
+
+def add_sequences_argument(parser, help="sequences in fasta or VCF format"):
+    """
+    Register the standard --sequences/-s input argument.
+    """
+    parser.add_argument('--sequences', '-s', required=True, help=help)
+
+
 def get_parent_name_by_child_name_for_tree(tree):
     '''
     Return dictionary mapping child node names to parent node names
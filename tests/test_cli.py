@@ -0,0 +1,148 @@
+import pytest
+
+from augur import cli
+from augur.__version__ import __version__
+
+
+@pytest.fixture
+def cache_home(tmpdir, monkeypatch):
+    """Point the parser cache at a throwaway directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    return tmpdir
+
+
+def render_help(parser, argv, capsys):
+    """Parse *argv* expecting the help exit, returning the rendered text."""
+    with pytest.raises(SystemExit):
+        parser.parse_args(argv)
+    return capsys.readouterr().out
+
+
+def registered_commands(parser):
+    """The command names a built parser knows about."""
+    return set(parser._subparsers._group_actions[0]._name_parser_map)
+
+
+class TestSniffCommand:
+    def test_finds_the_command(self):
+        assert cli.sniff_command(["tree", "--alignment", "aln.fasta"]) == "tree"
+
+    def test_skips_leading_options(self):
+        assert cli.sniff_command(["--some-flag", "tree"]) == "tree"
+
+    def test_uses_cli_spelling(self):
+        assert cli.sniff_command(["sequence-traits"]) == "sequence-traits"
+        assert cli.sniff_command(["sequence_traits"]) is None
+
+    def test_unknown_first_token_is_not_a_command(self):
+        # "tree" later in argv is an argument to the unknown token, not the
+        # command.
+        assert cli.sniff_command(["bogus", "tree"]) is None
+
+    def test_nothing_to_sniff(self):
+        assert cli.sniff_command([]) is None
+        assert cli.sniff_command(["--help"]) is None
+
+
+class TestVersionRequested:
+    def test_version_flag(self):
+        assert cli.version_requested(["--version"])
+
+    def test_version_flag_before_command(self):
+        assert cli.version_requested(["--version", "tree"])
+
+    def test_version_flag_after_command(self):
+        assert not cli.version_requested(["tree", "--version"])
+
+    def test_no_version_flag(self):
+        assert not cli.version_requested([])
+        assert not cli.version_requested(["tree"])
+
+
+class TestMakeParser:
+    def test_command_first_builds_only_that_command(self):
+        assert registered_commands(cli.make_parser(["tree", "--help"])) == {"tree"}
+
+    def test_help_before_command_builds_everything(self):
+        # `augur --help tree` renders the top-level help, which must list
+        # every command.
+        assert registered_commands(cli.make_parser(["--help", "tree"])) == set(cli.COMMANDS)
+
+    def test_no_command_builds_everything(self):
+        assert registered_commands(cli.make_parser(["--help"])) == set(cli.COMMANDS)
+        assert registered_commands(cli.make_parser()) == set(cli.COMMANDS)
+
+
+class TestParserCache:
+    def test_round_trip_parses_identically(self, cache_home):
+        argv = ["tree", "--alignment", "aln.fasta", "--nthreads", "2"]
+
+        fresh = cli.make_parser(argv).parse_args(argv)
+        cli.load_or_build_parser(argv)          # first call builds and writes the cache
+        cached = cli.load_or_build_parser(argv).parse_args(argv)
+
+        fresh_vars = vars(fresh)
+        cached_vars = vars(cached)
+        assert fresh_vars.keys() == cached_vars.keys()
+        assert fresh_vars["__command__"].module_name == cached_vars["__command__"].module_name
+        assert {k: v for k, v in fresh_vars.items() if k != "__command__"} \
+            == {k: v for k, v in cached_vars.items() if k != "__command__"}
+
+    def test_round_trip_renders_identical_help(self, cache_home, capsys):
+        argv = ["tree", "--help"]
+
+        fresh_help = render_help(cli.make_parser(argv), argv, capsys)
+        cli.load_or_build_parser(argv)
+        cached_help = render_help(cli.load_or_build_parser(argv), argv, capsys)
+
+        assert fresh_help == cached_help
+        # The identity-sensitive SUPPRESS sentinel must not leak into help
+        # after unpickling.
+        assert "==SUPPRESS==" not in cached_help
+
+    def test_second_call_hits_the_cache(self, cache_home, monkeypatch):
+        argv = ["version"]
+
+        cli.load_or_build_parser(argv)
+        monkeypatch.setattr(cli, "make_parser", lambda argv=None: pytest.fail("expected a cache hit"))
+        parser = cli.load_or_build_parser(argv)
+        assert vars(parser.parse_args(argv))["__command__"].module_name == "augur.version"
+
+    def test_corrupted_cache_falls_back_to_building(self, cache_home):
+        argv = ["version"]
+
+        cache_file = cli.parser_cache_file(cli.sniff_command(argv))
+        cli.load_or_build_parser(argv)
+        with open(cache_file, "wb") as file:
+            file.write(b"not a pickle")
+
+        parser = cli.load_or_build_parser(argv)
+        assert vars(parser.parse_args(argv))["__command__"].module_name == "augur.version"
+
+    def test_unwritable_cache_falls_back_to_building(self, monkeypatch):
+        argv = ["version"]
+
+        monkeypatch.setenv("XDG_CACHE_HOME", "/dev/null/nope")
+        parser = cli.load_or_build_parser(argv)
+        assert vars(parser.parse_args(argv))["__command__"].module_name == "augur.version"
+
+
+class TestVersionFastPath:
+    def test_version_command(self, capsys):
+        assert cli.run(["version"]) == 0
+        assert capsys.readouterr().out == "augur %s\n" % __version__
+
+    def test_version_flag(self, capsys):
+        assert cli.run(["--version"]) == 0
+        assert capsys.readouterr().out == "augur %s\n" % __version__
+
+    def test_version_flag_before_command(self, capsys):
+        assert cli.run(["--version", "tree"]) == 0
+        assert capsys.readouterr().out == "augur %s\n" % __version__
+
+    def test_version_flag_after_command_is_not_the_version(self, cache_home, capsys):
+        # --version after a command belongs to that command's parser, which
+        # doesn't define it; this must not short-circuit to the version.
+        with pytest.raises(SystemExit):
+            cli.run(["tree", "--version"])
+        assert "augur %s\n" % __version__ != capsys.readouterr().out